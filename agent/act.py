@@ -1,10 +1,20 @@
-import json
 import time
 from typing import Dict, Any, List
 from pathlib import Path
 
+from agent.enums import ActionType
+from agent.storage import BatchedLog, read_ndjson
 
-STATE_FILE = Path("agent_state.json")
+
+STATE_FILE = Path("agent_state.ndjson")
+
+
+def load_state() -> List[Dict[str, Any]]:
+    """
+    Read the flushed state history, one JSON record per line.
+    """
+
+    return read_ndjson(STATE_FILE)
 
 
 class Actor:
@@ -12,6 +22,10 @@ class Actor:
     Executes approved decisions in a safe, auditable way.
     """
 
+    def __init__(self):
+        # Append-only: updates are buffered and written in batches
+        self._log = BatchedLog(STATE_FILE)
+
     def act(self, decision_output: Dict[str, Any]) -> Dict[str, Any]:
         actions_taken = []
         pending_approvals = []
@@ -26,7 +40,7 @@ class Actor:
                 actions_taken.append(action)
 
         state_update = {
-            "timestamp": time.time(),
+            "timestamp_ns": time.time_ns(),
             "observation_id": decision_output["observation_id"],
             "actions_taken": actions_taken,
             "pending_approvals": pending_approvals,
@@ -43,13 +57,13 @@ class Actor:
     def _execute(self, decision: Dict[str, Any]) -> Dict[str, Any]:
         action_type = decision.get("type")
 
-        if action_type == "monitor_only":
+        if action_type == ActionType.MONITOR_ONLY:
             return self._monitor(decision)
 
-        if action_type == "support_guidance":
+        if action_type == ActionType.SUPPORT_GUIDANCE:
             return self._support_guidance(decision)
 
-        if action_type == "escalate_engineering":
+        if action_type == ActionType.ESCALATE_ENGINEERING:
             return self._escalate_engineering(decision)
 
         # Unknown or blocked action
@@ -89,16 +103,7 @@ class Actor:
     # -----------------------
 
     def _write_state(self, update: Dict[str, Any]) -> None:
-        existing = []
-
-        if STATE_FILE.exists():
-            with open(STATE_FILE, "r") as f:
-                try:
-                    existing = json.load(f)
-                except json.JSONDecodeError:
-                    existing = []
-
-        existing.append(update)
+        self._log.append(update)
 
-        with open(STATE_FILE, "w") as f:
-            json.dump(existing, f, indent=2)
+    def close(self) -> None:
+        self._log.close()
@@ -1,4 +1,6 @@
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
+
+from agent.enums import ActionType, Cause
 
 
 class Decider:
@@ -9,6 +11,16 @@ class Decider:
     PURE POLICY LAYER.
     """
 
+    def __init__(self):
+        # Cause -> policy handler; unlisted causes fall back to monitoring
+        self._dispatch: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+            Cause.PLATFORM_REGRESSION: self._handle_platform_regression,
+            Cause.WEBHOOK_AUTH_FAILURE: self._handle_webhook_auth_failure,
+            Cause.FRONTEND_BACKEND_MISMATCH: self._handle_frontend_mismatch,
+            Cause.MIGRATION_MISCONFIGURATION: self._handle_migration_misconfiguration,
+            Cause.NORMAL_OPERATION: self._handle_normal_operation,
+        }
+
     def decide(
         self,
         observation: Dict[str, Any],
@@ -21,7 +33,7 @@ class Decider:
         decisions = []
         top_hypothesis = self._get_top_hypothesis(hypotheses)
 
-        cause = top_hypothesis.get("cause", "unknown")
+        cause = top_hypothesis.get("cause", Cause.UNKNOWN.value)
 
         # ----------------------------
         # SAFETY GATES
@@ -37,64 +49,69 @@ class Decider:
         # POLICY BY CAUSE (KEY FIX)
         # ----------------------------
 
-        # 🔴 Platform regression → immediate escalation
-        if cause == "platform_regression":
-            decisions.append(
-                self._escalate_engineering(
-                    severity="high",
-                    reason="Suspected platform regression across services",
-                    requires_human_approval=False
-                )
-            )
+        handler = self._dispatch.get(cause, self._handle_unknown)
+        decisions.extend(handler())
 
-        # 🟠 Webhook auth failure → support guidance
-        elif cause == "webhook_auth_failure":
-            decisions.append(
-                self._support_guidance(
-                    reason="Webhook authentication failures detected",
-                    requires_human_approval=False
-                )
-            )
+        return self._finalize(decisions, observation, reasoning)
 
-        # 🟡 Frontend/backend mismatch → documentation + monitoring
-        elif cause == "frontend_backend_mismatch":
-            decisions.append(
-                self._documentation_update(
-                    reason="Frontend and backend state mismatch observed",
-                )
+    # ------------------------------------------------
+    # POLICY HANDLERS
+    # ------------------------------------------------
+
+    # 🔴 Platform regression → immediate escalation
+    def _handle_platform_regression(self) -> List[Dict[str, Any]]:
+        return [
+            self._escalate_engineering(
+                severity="high",
+                reason="Suspected platform regression across services",
+                requires_human_approval=False
             )
-            decisions.append(
-                self._monitor_only(
-                    "Mismatch may resolve after configuration sync"
-                )
+        ]
+
+    # 🟠 Webhook auth failure → support guidance
+    def _handle_webhook_auth_failure(self) -> List[Dict[str, Any]]:
+        return [
+            self._support_guidance(
+                reason="Webhook authentication failures detected",
+                requires_human_approval=False
             )
-
-        # 🟢 Migration misconfiguration → guided support
-        elif cause == "migration_misconfiguration":
-            decisions.append(
-                self._support_guidance(
-                    reason="Likely merchant-side migration misconfiguration",
-                    requires_human_approval=False
-                )
+        ]
+
+    # 🟡 Frontend/backend mismatch → documentation + monitoring
+    def _handle_frontend_mismatch(self) -> List[Dict[str, Any]]:
+        return [
+            self._documentation_update(
+                reason="Frontend and backend state mismatch observed",
+            ),
+            self._monitor_only(
+                "Mismatch may resolve after configuration sync"
+            ),
+        ]
+
+    # 🟢 Migration misconfiguration → guided support
+    def _handle_migration_misconfiguration(self) -> List[Dict[str, Any]]:
+        return [
+            self._support_guidance(
+                reason="Likely merchant-side migration misconfiguration",
+                requires_human_approval=False
             )
+        ]
 
-        # 🟢 Normal operation → no action
-        elif cause == "normal_operation":
-            decisions.append(
-                self._monitor_only(
-                    "System operating normally"
-                )
+    # 🟢 Normal operation → no action
+    def _handle_normal_operation(self) -> List[Dict[str, Any]]:
+        return [
+            self._monitor_only(
+                "System operating normally"
             )
+        ]
 
-        # ⚪ Unknown → cautious monitoring
-        else:
-            decisions.append(
-                self._monitor_only(
-                    "Root cause unclear, monitoring for changes"
-                )
+    # ⚪ Unknown → cautious monitoring
+    def _handle_unknown(self) -> List[Dict[str, Any]]:
+        return [
+            self._monitor_only(
+                "Root cause unclear, monitoring for changes"
             )
-
-        return self._finalize(decisions, observation, reasoning)
+        ]
 
     # ------------------------------------------------
     # HELPERS
@@ -102,7 +119,7 @@ class Decider:
 
     def _get_top_hypothesis(self, hypotheses: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not hypotheses:
-            return {"cause": "unknown", "confidence": 0.0}
+            return {"cause": Cause.UNKNOWN.value, "confidence": 0.0}
         return max(hypotheses, key=lambda h: h.get("confidence", 0))
 
     def _finalize(
@@ -123,7 +140,7 @@ class Decider:
         }
 
     def _assess_risk(self, decisions: List[Dict[str, Any]]) -> str:
-        if any(d["type"] == "escalate_engineering" for d in decisions):
+        if any(d["type"] == ActionType.ESCALATE_ENGINEERING for d in decisions):
             return "high"
         if any(d.get("requires_human_approval") for d in decisions):
             return "medium"
@@ -135,7 +152,7 @@ class Decider:
 
     def _monitor_only(self, reason: str) -> Dict[str, Any]:
         return {
-            "type": "monitor_only",
+            "type": ActionType.MONITOR_ONLY.value,
             "reason": reason,
             "requires_human_approval": False
         }
@@ -146,7 +163,7 @@ class Decider:
         requires_human_approval: bool
     ) -> Dict[str, Any]:
         return {
-            "type": "support_guidance",
+            "type": ActionType.SUPPORT_GUIDANCE.value,
             "reason": reason,
             "requires_human_approval": requires_human_approval
         }
@@ -158,7 +175,7 @@ class Decider:
         requires_human_approval: bool
     ) -> Dict[str, Any]:
         return {
-            "type": "escalate_engineering",
+            "type": ActionType.ESCALATE_ENGINEERING.value,
             "severity": severity,
             "reason": reason,
             "requires_human_approval": requires_human_approval
@@ -166,7 +183,7 @@ class Decider:
 
     def _documentation_update(self, reason: str) -> Dict[str, Any]:
         return {
-            "type": "documentation_update_suggestion",
+            "type": ActionType.DOCUMENTATION_UPDATE_SUGGESTION.value,
             "reason": reason,
             "requires_human_approval": True
         }
@@ -180,7 +197,7 @@ class Decider:
         return {
             "observation_id": observation["observation_id"],
             "decisions": [{
-                "type": "block_auto_actions",
+                "type": ActionType.BLOCK_AUTO_ACTIONS.value,
                 "reason": reason,
                 "requires_human_approval": True
             }],
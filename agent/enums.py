@@ -0,0 +1,26 @@
+from enum import Enum
+
+
+class Cause(str, Enum):
+    """
+    Root causes the reasoner emits and the decider has policy for.
+    """
+
+    PLATFORM_REGRESSION = "platform_regression"
+    WEBHOOK_AUTH_FAILURE = "webhook_auth_failure"
+    FRONTEND_BACKEND_MISMATCH = "frontend_backend_mismatch"
+    MIGRATION_MISCONFIGURATION = "migration_misconfiguration"
+    NORMAL_OPERATION = "normal_operation"
+    UNKNOWN = "unknown"
+
+
+class ActionType(str, Enum):
+    """
+    Decision types produced by the decider and dispatched by the actor.
+    """
+
+    MONITOR_ONLY = "monitor_only"
+    SUPPORT_GUIDANCE = "support_guidance"
+    ESCALATE_ENGINEERING = "escalate_engineering"
+    DOCUMENTATION_UPDATE_SUGGESTION = "documentation_update_suggestion"
+    BLOCK_AUTO_ACTIONS = "block_auto_actions"
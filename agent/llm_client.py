@@ -1,5 +1,6 @@
+import orjson
 import requests
-import json
+from requests.adapters import HTTPAdapter
 
 
 class OllamaClient:
@@ -20,6 +21,13 @@ class OllamaClient:
         self.model = model
         self.base_url = base_url
 
+        # Keep-alive session so the TCP handshake is paid once, not per call
+        self._session = requests.Session()
+        self._session.mount(
+            base_url,
+            HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        )
+
     def generate(self, prompt: str) -> dict:
         payload = {
             "model": self.model,
@@ -28,7 +36,7 @@ class OllamaClient:
             "format": "json"
         }
 
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/generate",
             json=payload,
             timeout=300
@@ -36,7 +44,8 @@ class OllamaClient:
 
         response.raise_for_status()
 
-        raw = response.json()
+        # Parse the envelope straight from bytes, skipping requests' json()
+        raw = orjson.loads(response.content)
 
         # Ollama returns generated text under "response"
         text = raw.get("response", "")
@@ -48,8 +57,8 @@ class OllamaClient:
 
         # Strict JSON parse
         try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError as e:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError as e:
             raise ValueError(
                 f"LLM returned invalid JSON:\n{text}"
             ) from e
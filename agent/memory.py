@@ -1,21 +1,45 @@
-import json
 import time
 import uuid
 from pathlib import Path
 from typing import Dict, Any, List
 
+from agent.storage import BatchedLog, read_ndjson
 
-MEMORY_FILE = Path("agent_memory.json")
+
+MEMORY_FILE = Path("agent_memory.ndjson")
+OUTCOMES_FILE = Path("agent_outcomes.ndjson")
+
+# Rewrite the memory file once this many outcomes are pending in the log
+COMPACT_THRESHOLD = 100
 
 
 class Memory:
     """
     Append-only persistent memory for agent incidents.
+
+    Incidents are stored one JSON record per line. Outcome feedback is
+    appended to a separate log and merged back in at load time, so no
+    call ever rewrites the whole history (except compaction). Both logs
+    are written in batches; the in-memory view is always current.
     """
 
     def __init__(self):
-        if not MEMORY_FILE.exists():
-            MEMORY_FILE.write_text("[]")
+        self._cache: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, int] = {}
+        self._by_cause: Dict[str, List[int]] = {}
+        self._outcomes_logged = 0
+
+        for incident in read_ndjson(MEMORY_FILE):
+            self._index(incident)
+
+        for entry in read_ndjson(OUTCOMES_FILE):
+            idx = self._by_id.get(entry["incident_id"])
+            if idx is not None:
+                self._cache[idx]["outcome"] = entry["outcome"]
+            self._outcomes_logged += 1
+
+        self._log = BatchedLog(MEMORY_FILE)
+        self._outcomes_log = BatchedLog(OUTCOMES_FILE)
 
     def record_incident(
         self,
@@ -30,7 +54,7 @@ class Memory:
 
         incident = {
             "incident_id": str(uuid.uuid4()),
-            "timestamp": time.time(),
+            "timestamp_ns": time.time_ns(),
             "observation": observation,
             "reasoning": reasoning,
             "decision": decision,
@@ -38,9 +62,8 @@ class Memory:
             "outcome": None
         }
 
-        memory = self._load()
-        memory.append(incident)
-        self._save(memory)
+        self._index(incident)
+        self._log.append(incident)
 
         return incident["incident_id"]
 
@@ -53,17 +76,24 @@ class Memory:
         Attach outcome feedback to an existing incident.
         """
 
-        memory = self._load()
+        idx = self._by_id.get(incident_id)
+        if idx is None:
+            return
 
-        for entry in memory:
-            if entry["incident_id"] == incident_id:
-                entry["outcome"] = {
-                    "timestamp": time.time(),
-                    **outcome
-                }
-                break
+        entry = self._cache[idx]
+        entry["outcome"] = {
+            "timestamp_ns": time.time_ns(),
+            **outcome
+        }
 
-        self._save(memory)
+        self._outcomes_log.append({
+            "incident_id": incident_id,
+            "outcome": entry["outcome"]
+        })
+        self._outcomes_logged += 1
+
+        if self._outcomes_logged > COMPACT_THRESHOLD:
+            self.compact()
 
     def query_similar(
         self,
@@ -74,13 +104,21 @@ class Memory:
         Retrieve past incidents matching a cause and confidence threshold.
         """
 
-        memory = self._load()
+        if not cause:
+            return [
+                entry for entry in self._cache
+                if any(
+                    h.get("confidence", 0) >= min_confidence
+                    for h in entry["reasoning"].get("hypotheses", [])
+                )
+            ]
+
         results = []
 
-        for entry in memory:
-            hypotheses = entry["reasoning"].get("hypotheses", [])
-            for h in hypotheses:
-                if cause and h.get("cause") != cause:
+        for idx in self._by_cause.get(cause, ()):
+            entry = self._cache[idx]
+            for h in entry["reasoning"].get("hypotheses", []):
+                if h.get("cause") != cause:
                     continue
                 if h.get("confidence", 0) < min_confidence:
                     continue
@@ -89,14 +127,40 @@ class Memory:
 
         return results
 
+    def compact(self) -> None:
+        """
+        Rewrite the memory file with outcomes merged in and clear the
+        outcome log.
+        """
+
+        self._log.rewrite(self._cache)
+        self._outcomes_log.rewrite([])
+        self._outcomes_logged = 0
+
+    def close(self) -> None:
+        """
+        Flush both logs and release their file descriptors.
+        """
+
+        self._log.close()
+        self._outcomes_log.close()
+
     # -----------------------
     # Internal helpers
     # -----------------------
 
-    def _load(self) -> List[Dict[str, Any]]:
-        with open(MEMORY_FILE, "r") as f:
-            return json.load(f)
-
-    def _save(self, memory: List[Dict[str, Any]]) -> None:
-        with open(MEMORY_FILE, "w") as f:
-            json.dump(memory, f, indent=2)
+    def _index(self, incident: Dict[str, Any]) -> None:
+        idx = len(self._cache)
+        self._by_id[incident["incident_id"]] = idx
+        self._cache.append(incident)
+
+        # Older records may carry a dict or list cause; those can never
+        # equal a queried cause string, and are not hashable, so skip them
+        causes = set()
+        for h in incident["reasoning"].get("hypotheses", []):
+            cause = h.get("cause")
+            if isinstance(cause, str):
+                causes.add(cause)
+
+        for cause in causes:
+            self._by_cause.setdefault(cause, []).append(idx)
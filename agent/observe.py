@@ -1,7 +1,17 @@
 import json
 import time
-from collections import defaultdict
-from typing import Dict, Any, List
+from collections import Counter
+from typing import Dict, Any, List, Mapping, Sequence, Tuple
+
+
+# Signal buckets every observation carries, in order
+_SIGNAL_KEYS = (
+    "tickets",
+    "errors",
+    "checkouts",
+    "webhooks",
+    "migration_states",
+)
 
 
 class Observer:
@@ -15,106 +25,90 @@ class Observer:
     def __init__(self):
         self.observation_id = 0
 
-    def observe(self, raw_signals: Dict[str, Any]) -> Dict[str, Any]:
+    def observe(self, raw_signals: Mapping[str, Any]) -> Dict[str, Any]:
         """
         Main observe loop entrypoint.
         Takes raw system signals and produces a structured observation.
         """
 
         self.observation_id += 1
-
-        observation = {
-            "observation_id": self.observation_id,
-            "timestamp": time.time(),
-            "signals": {},
-            "stats": {},
-            "anomalies": [],
-            "confidence": 1.0
-        }
+        timestamp = time.time()
 
         # 1. Ingest raw signals
-        observation["signals"] = self._ingest_signals(raw_signals)
-
-        # 2. Compute lightweight statistics (NOT conclusions)
-        observation["stats"] = self._compute_stats(observation["signals"])
+        signals = self._ingest_signals(raw_signals)
 
-        # 3. Detect surface-level anomalies (counts, spikes only)
-        observation["anomalies"] = self._detect_anomalies(
-            observation["signals"],
-            observation["stats"]
-        )
+        # 2. Compute lightweight statistics (NOT conclusions) and
+        # 3. detect surface-level anomalies (counts, spikes only)
+        stats, anomalies = self._compute_stats(signals)
 
         # 4. Adjust confidence if data is incomplete or noisy
-        observation["confidence"] = self._estimate_confidence(
-            observation["signals"]
-        )
+        confidence = self._estimate_confidence(signals)
 
-        return observation
+        return {
+            "observation_id": self.observation_id,
+            "timestamp": timestamp,
+            "signals": signals,
+            "stats": stats,
+            "anomalies": anomalies,
+            "confidence": confidence
+        }
 
     # -------------------------
     # Internal helper methods
     # -------------------------
 
-    def _ingest_signals(self, raw_signals: Dict[str, Any]) -> Dict[str, Any]:
+    def _ingest_signals(self, raw_signals: Mapping[str, Any]) -> Dict[str, Any]:
         """
         Normalize incoming signals into predictable buckets.
         """
 
-        return {
-            "tickets": raw_signals.get("tickets", []),
-            "errors": raw_signals.get("errors", []),
-            "checkouts": raw_signals.get("checkouts", []),
-            "webhooks": raw_signals.get("webhooks", []),
-            "migration_states": raw_signals.get("migration_states", [])
-        }
+        # Missing buckets share the empty-tuple singleton
+        return {key: raw_signals.get(key, ()) for key in _SIGNAL_KEYS}
 
-    def _compute_stats(self, signals: Dict[str, Any]) -> Dict[str, Any]:
+    def _compute_stats(
+        self,
+        signals: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        Compute simple counts and frequencies.
+        Compute simple counts and frequencies, and flag obvious anomalies
+        without reasoning about cause.
         No inference.
-        """
 
-        stats = {}
+        Each signal list is walked exactly once.
+        """
 
-        stats["ticket_count"] = len(signals["tickets"])
-        stats["error_count"] = len(signals["errors"])
-        stats["failed_checkouts"] = sum(
-            1 for c in signals["checkouts"] if c.get("status") == "failed"
-        )
+        failed_checkouts = 0
+        for c in signals["checkouts"]:
+            if c.get("status") == "failed":
+                failed_checkouts += 1
 
         # Count error types
-        error_types = defaultdict(int)
-        for error in signals["errors"]:
-            error_types[error.get("type", "unknown")] += 1
-        stats["error_types"] = dict(error_types)
+        error_types = self._count_labels(signals["errors"], "type")
 
         # Count migration stages
-        migration_stage_counts = defaultdict(int)
-        for m in signals["migration_states"]:
-            migration_stage_counts[m.get("stage", "unknown")] += 1
-        stats["migration_stage_distribution"] = dict(migration_stage_counts)
-
-        return stats
+        migration_stage_counts = self._count_labels(
+            signals["migration_states"],
+            "stage"
+        )
 
-    def _detect_anomalies(
-        self,
-        signals: Dict[str, Any],
-        stats: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """
-        Detect obvious anomalies without reasoning about cause.
-        """
+        stats = {
+            "ticket_count": len(signals["tickets"]),
+            "error_count": len(signals["errors"]),
+            "failed_checkouts": failed_checkouts,
+            "error_types": error_types,
+            "migration_stage_distribution": migration_stage_counts,
+        }
 
         anomalies = []
 
-        if stats["failed_checkouts"] > 0:
+        if failed_checkouts > 0:
             anomalies.append({
                 "type": "checkout_failures",
-                "count": stats["failed_checkouts"],
+                "count": failed_checkouts,
                 "severity": "high"
             })
 
-        for error_type, count in stats["error_types"].items():
+        for error_type, count in error_types.items():
             if count >= 5:
                 anomalies.append({
                     "type": "repeated_error",
@@ -123,7 +117,19 @@ class Observer:
                     "severity": "medium"
                 })
 
-        return anomalies
+        return stats, anomalies
+
+    def _count_labels(
+        self,
+        items: Sequence[Dict[str, Any]],
+        key: str
+    ) -> Dict[str, int]:
+        """
+        Count occurrences of items[key], in first-seen order.
+        """
+
+        # Counter's bulk constructor runs the increment loop in C
+        return dict(Counter(item.get(key, "unknown") for item in items))
 
     def _estimate_confidence(self, signals: Dict[str, Any]) -> float:
         """
@@ -1,7 +1,57 @@
 import os
+import sys
+import logging
 import json
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any
 
+import orjson
+
+from agent.enums import Cause
+
+
+log = logging.getLogger(__name__)
+
+
+# Maximum number of cached LLM reasoning results (least recently used is evicted)
+LLM_CACHE_SIZE = 1024
+
+# Deterministic results at or above this confidence skip the LLM entirely
+DETERMINISTIC_CONFIDENCE_THRESHOLD = 0.75
+
+# Static prompt, built once; only the DATA section varies per call
+_PROMPT_TEMPLATE = """
+You are an automated incident analysis system.
+
+STRICT RULES:
+- Return VALID JSON ONLY
+- Do NOT add nested objects
+- Do NOT add justification fields
+- Follow the schema EXACTLY
+
+SCHEMA:
+{{
+  "hypotheses": [
+    {{
+      "cause": "<snake_case_string>",
+      "explanation": "<short string>",
+      "confidence": <number between 0 and 1>
+    }}
+  ],
+  "assumptions": ["<string>"],
+  "unknowns": ["<string>"],
+  "confidence": <number between 0 and 1>
+}}
+
+DATA:
+Stats: {stats}
+Anomalies: {anomalies}
+
+Return JSON ONLY.
+""".strip()
+
 
 class Reasoner:
     """
@@ -10,26 +60,56 @@ class Reasoner:
     - Deterministic reasoning for clear cases
     - LLM reasoning for ambiguous or mixed cases
 
+    Deterministic rules always run first; the LLM is only consulted
+    when they fall below deterministic_threshold.
+
     LLM is ENABLED BY DEFAULT.
     Disable with:
         USE_LLM=false
     """
 
-    def __init__(self, llm=None):
+    def __init__(
+        self,
+        llm=None,
+        deterministic_threshold: float = DETERMINISTIC_CONFIDENCE_THRESHOLD
+    ):
         self.llm = llm
+        self.deterministic_threshold = deterministic_threshold
+        self.reload_env()
+        self._llm_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
 
     # ==================================================
     # ENTRY POINT
     # ==================================================
     def reason(self, observation: Dict[str, Any]) -> Dict[str, Any]:
-        use_llm_env = os.getenv("USE_LLM", "true").lower() == "true"
-
-        if self.llm and use_llm_env and self._should_use_llm(observation):
-            print("🧠 LLM reasoning enabled")
+        deterministic = self._reason_deterministic(observation)
+
+        # Cheap path already confident -> no need to pay for the LLM.
+        # The normal_operation fallback only counts when nothing looks off:
+        # anomalies no rule explains are exactly what the LLM is for.
+        fallback = (
+            deterministic["hypotheses"][0]["cause"]
+            == Cause.NORMAL_OPERATION.value
+        )
+        if (
+            deterministic["confidence"] >= self.deterministic_threshold
+            and not (fallback and observation.get("anomalies"))
+        ):
+            log.debug("Deterministic reasoning")
+            return deterministic
+
+        if self.llm and self._use_llm_env and self._should_use_llm(observation):
+            log.debug("LLM reasoning enabled")
             return self._reason_with_llm(observation)
 
-        print("⚡ Deterministic reasoning")
-        return self._reason_deterministic(observation)
+        log.debug("Deterministic reasoning")
+        return deterministic
+
+    def reload_env(self) -> None:
+        """
+        Re-read USE_LLM; it is otherwise read once at construction.
+        """
+        self._use_llm_env = os.getenv("USE_LLM", "true").lower() == "true"
 
     # ==================================================
     # LLM ESCALATION LOGIC
@@ -53,75 +133,46 @@ class Reasoner:
         if isinstance(value, str):
             return value
         if isinstance(value, dict):
-            return (
+            text = (
                 value.get("description")
                 or value.get("explanation")
                 or value.get("justification")
-                or json.dumps(value)
             )
+            # Nested fields may themselves be objects; always end on a str
+            if text:
+                return self._stringify(text)
+            return json.dumps(value, default=str)
         return str(value)
 
+    def _intern_cause(self, value) -> str:
+        # Known causes then share one str object with Cause's values
+        return sys.intern(self._stringify(value))
+
     # ==================================================
     # LLM REASONING (HARDENED)
     # ==================================================
     def _reason_with_llm(self, observation: Dict[str, Any]) -> Dict[str, Any]:
-        print("🧠 ACTUALLY CALLING OLLAMA")
+        key = self._cache_key(observation)
 
-        try:
-            prompt = self._build_prompt(observation)
-            response = self.llm.generate(prompt)
-
-            # -------- Normalize confidence --------
-            confidence = response.get("confidence", 0.5)
-            if not isinstance(confidence, (int, float)):
-                confidence = 0.5
-
-            # -------- Normalize hypotheses --------
-            hypotheses = []
-            raw_hypotheses = response.get("hypotheses", [])
-
-            if isinstance(raw_hypotheses, list):
-                for h in raw_hypotheses:
-                    if isinstance(h, dict):
-                        hypotheses.append({
-                            "cause": h.get("cause", "unknown"),
-                            "explanation": h.get("explanation", ""),
-                            "confidence": float(h.get("confidence", confidence)),
-                        })
-                    elif isinstance(h, str):
-                        hypotheses.append({
-                            "cause": h,
-                            "explanation": "",
-                            "confidence": confidence,
-                        })
-
-            if not hypotheses:
-                hypotheses.append({
-                    "cause": "unknown",
-                    "explanation": "LLM did not return a valid hypothesis",
-                    "confidence": 0.4,
-                })
+        # The cached entry is a finished result that Memory keeps and hands
+        # out, so every caller gets its own copy rather than a shared one
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+            return copy.deepcopy(cached)
 
-            return {
-                "reasoning_mode": "llm",
-                "hypotheses": hypotheses,
-                "assumptions": [
-                    self._stringify(a)
-                    for a in response.get("assumptions", [])
-                ],
-                "unknowns": [
-                    self._stringify(u)
-                    for u in response.get("unknowns", [])
-                ],
-                "confidence": confidence,
-            }
+        log.debug("Calling Ollama")
+
+        try:
+            response = self.llm.generate(self._build_prompt(observation))
+            result = self._normalize_response(response)
 
         except Exception as e:
-            print("❌ LLM FAILURE:", e)
+            log.warning("LLM failure: %s", e)
             return {
                 "reasoning_mode": "llm_failed",
                 "hypotheses": [{
-                    "cause": "unknown",
+                    "cause": Cause.UNKNOWN.value,
                     "explanation": "LLM failed or returned malformed output",
                     "confidence": 0.4,
                 }],
@@ -131,6 +182,85 @@ class Reasoner:
                 "error": str(e),
             }
 
+        # Only results that normalized cleanly are cached, so a malformed
+        # reply is retried next time instead of being pinned
+        self._llm_cache[key] = result
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    def _normalize_response(self, response: dict) -> Dict[str, Any]:
+        # -------- Normalize confidence --------
+        confidence = response.get("confidence", 0.5)
+        if not isinstance(confidence, (int, float)):
+            confidence = 0.5
+
+        # -------- Normalize hypotheses --------
+        raw_hypotheses = response.get("hypotheses", [])
+        if not isinstance(raw_hypotheses, list):
+            raw_hypotheses = []
+
+        hypotheses = [
+            self._normalize_hypothesis(h, confidence)
+            for h in raw_hypotheses
+            if isinstance(h, (dict, str))
+        ]
+
+        if not hypotheses:
+            hypotheses = [{
+                "cause": Cause.UNKNOWN.value,
+                "explanation": "LLM did not return a valid hypothesis",
+                "confidence": 0.4,
+            }]
+
+        return {
+            "reasoning_mode": "llm",
+            "hypotheses": hypotheses,
+            "assumptions": [
+                self._stringify(a)
+                for a in response.get("assumptions", [])
+            ],
+            "unknowns": [
+                self._stringify(u)
+                for u in response.get("unknowns", [])
+            ],
+            "confidence": confidence,
+        }
+
+    def _normalize_hypothesis(self, h, confidence: float) -> Dict[str, Any]:
+        if isinstance(h, str):
+            return {
+                "cause": self._intern_cause(h),
+                "explanation": "",
+                "confidence": confidence,
+            }
+
+        return {
+            "cause": self._intern_cause(h.get("cause", Cause.UNKNOWN.value)),
+            "explanation": self._stringify(h.get("explanation", "")),
+            "confidence": float(h.get("confidence", confidence)),
+        }
+
+    # ==================================================
+    # LLM RESULT CACHE
+    # ==================================================
+    def _cache_key(self, observation: Dict[str, Any]) -> bytes:
+        """
+        Hash of the stats/anomalies the prompt is built from; identical
+        inputs reuse the normalized reasoning instead of calling the LLM.
+        """
+        # Sorted keys so equal inputs always hash identically
+        return hashlib.blake2b(
+            orjson.dumps(
+                (
+                    observation.get("stats", {}),
+                    observation.get("anomalies", []),
+                ),
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        ).digest()
+
     # ==================================================
     # DETERMINISTIC REASONING (UNCHANGED, GOOD)
     # ==================================================
@@ -139,41 +269,52 @@ class Reasoner:
         error_types = stats.get("error_types", {})
 
         hypotheses = []
+        # Highest confidence so far, tracked as rules fire
+        best = 0.0
 
         if stats.get("failed_checkouts", 0) >= 5:
             hypotheses.append({
-                "cause": "migration_misconfiguration",
+                "cause": Cause.MIGRATION_MISCONFIGURATION.value,
                 "explanation": "High number of checkout failures detected after migration",
                 "confidence": 0.8,
             })
+            if best < 0.8:
+                best = 0.8
 
         if error_types.get("webhook_401", 0) >= 3:
             hypotheses.append({
-                "cause": "webhook_auth_failure",
+                "cause": Cause.WEBHOOK_AUTH_FAILURE.value,
                 "explanation": "Repeated webhook authentication failures detected",
                 "confidence": 0.7,
             })
+            if best < 0.7:
+                best = 0.7
 
         if error_types.get("frontend_state_mismatch", 0) >= 3:
             hypotheses.append({
-                "cause": "frontend_backend_mismatch",
+                "cause": Cause.FRONTEND_BACKEND_MISMATCH.value,
                 "explanation": "Frontend and backend states are inconsistent",
                 "confidence": 0.65,
             })
+            if best < 0.65:
+                best = 0.65
 
         if error_types.get("unknown", 0) >= 10:
             hypotheses.append({
-                "cause": "platform_regression",
+                "cause": Cause.PLATFORM_REGRESSION.value,
                 "explanation": "High volume of unknown errors suggests a platform regression",
                 "confidence": 0.6,
             })
+            if best < 0.6:
+                best = 0.6
 
         if not hypotheses:
             hypotheses.append({
-                "cause": "normal_operation",
+                "cause": Cause.NORMAL_OPERATION.value,
                 "explanation": "System signals are within expected parameters",
                 "confidence": 0.9,
             })
+            best = 0.9
 
         return {
             "reasoning_mode": "deterministic",
@@ -184,42 +325,16 @@ class Reasoner:
             "unknowns": [
                 "Merchant-specific configurations not visible"
             ],
-            "confidence": max(h["confidence"] for h in hypotheses),
+            "confidence": best,
         }
 
     # ==================================================
     # PROMPT BUILDER (STRICT CONTRACT)
     # ==================================================
     def _build_prompt(self, observation: Dict[str, Any]) -> str:
-        stats = observation.get("stats", {})
-        anomalies = observation.get("anomalies", [])
-
-        return f"""
-You are an automated incident analysis system.
-
-STRICT RULES:
-- Return VALID JSON ONLY
-- Do NOT add nested objects
-- Do NOT add justification fields
-- Follow the schema EXACTLY
-
-SCHEMA:
-{{
-  "hypotheses": [
-    {{
-      "cause": "<snake_case_string>",
-      "explanation": "<short string>",
-      "confidence": <number between 0 and 1>
-    }}
-  ],
-  "assumptions": ["<string>"],
-  "unknowns": ["<string>"],
-  "confidence": <number between 0 and 1>
-}}
-
-DATA:
-Stats: {stats}
-Anomalies: {anomalies}
-
-Return JSON ONLY.
-""".strip()
+        return _PROMPT_TEMPLATE.format_map({
+            "stats": orjson.dumps(
+                observation.get("stats", {}), option=orjson.OPT_NON_STR_KEYS
+            ).decode(),
+            "anomalies": orjson.dumps(observation.get("anomalies", [])).decode(),
+        })
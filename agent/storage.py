@@ -0,0 +1,160 @@
+import atexit
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, List
+
+import orjson
+
+
+# Records buffered in memory before a batch is written to disk
+BATCH_SIZE = 10
+
+# Seconds a buffered record may wait before a timer flushes the batch
+FLUSH_MAX_DELAY = 5.0
+
+# Keep Windows from translating LF to CRLF on raw descriptors
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def read_ndjson(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read every record from an NDJSON file (one JSON object per line).
+    """
+
+    if not path.exists():
+        return []
+
+    with open(path, "rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+class BatchedLog:
+    """
+    Append-only NDJSON log.
+
+    Records are encoded as they are appended, so a record that cannot
+    be serialized fails at its own call. The encoded lines are buffered
+    and each batch is written with a single os.write() on a pre-opened
+    descriptor once batch_size records are pending, or by a timer armed
+    when the first record of a batch is buffered, max_delay seconds
+    later. Pending records are flushed automatically at interpreter
+    shutdown; close() flushes and releases the log earlier.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = BATCH_SIZE,
+        max_delay: float = FLUSH_MAX_DELAY
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._pending: List[bytes] = []
+        self._timer = None
+        # The flush timer runs on its own thread
+        self._lock = threading.Lock()
+        self._fd = self._open()
+
+        atexit.register(self.flush)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        line = self._encode_one(record)
+
+        with self._lock:
+            self._pending.append(line)
+
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """
+        Flush pending records, close the descriptor and drop the
+        shutdown hook so the log can be garbage collected.
+        """
+
+        with self._lock:
+            if self._fd < 0:
+                return
+
+            self._flush()
+            os.close(self._fd)
+            self._fd = -1
+
+        atexit.unregister(self.flush)
+
+    def rewrite(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Atomically replace the log contents with records, dropping
+        anything still pending.
+        """
+
+        with self._lock:
+            self._rewrite(records)
+
+    # -----------------------
+    # Internal helpers
+    # -----------------------
+
+    def _flush(self) -> None:
+        self._cancel_timer()
+
+        if not self._pending:
+            return
+
+        self._write_all(self._fd, b"".join(self._pending))
+        self._pending.clear()
+
+    def _rewrite(self, records: Iterable[Dict[str, Any]]) -> None:
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        fd = os.open(
+            tmp,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+            0o644
+        )
+        try:
+            self._write_all(fd, self._encode(records))
+        finally:
+            os.close(fd)
+
+        # Windows refuses to replace a file that is still open
+        os.close(self._fd)
+        os.replace(tmp, self.path)
+
+        self._fd = self._open()
+        self._pending.clear()
+        self._cancel_timer()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _open(self) -> int:
+        return os.open(
+            self.path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_BINARY,
+            0o644
+        )
+
+    def _encode_one(self, record: Dict[str, Any]) -> bytes:
+        # Non-str keys (e.g. a None error type) are stringified, as json did
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+    def _encode(self, records: Iterable[Dict[str, Any]]) -> bytes:
+        return b"".join(self._encode_one(r) for r in records)
+
+    def _write_all(self, fd: int, buf: bytes) -> None:
+        view = memoryview(buf)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
@@ -1,3 +1,4 @@
+import logging
 import threading
 import webbrowser
 import http.server
@@ -5,6 +6,8 @@ import socketserver
 import time
 import random
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from agent.observe import Observer
 from agent.reason import Reasoner
@@ -36,63 +39,56 @@ def open_browser():
 
 
 # -----------------------------
-# Scenario Generators (MEANINGFUL)
+# Scenarios (MEANINGFUL, built once at import)
 # -----------------------------
-def scenario_checkout_failure():
-    return {
-        "tickets": [{"id": i} for i in range(25)],
-        "errors": [
-            {"type": "checkout_timeout", "service": "checkout"}
-            for _ in range(10)
-        ],
-        "checkouts": [{"status": "failed"} for _ in range(8)],
-        "webhooks": [],
-        "migration_states": [{"stage": "post-cutover"}],
-    }
-
-
-def scenario_webhook_failure():
-    return {
-        "tickets": [{"id": i} for i in range(15)],
-        "errors": [
-            {"type": "webhook_401", "service": "webhook"}
-            for _ in range(6)
-        ],
-        "checkouts": [{"status": "success"} for _ in range(20)],
-        "webhooks": [{"status": "failed"} for _ in range(6)],
-        "migration_states": [{"stage": "post-cutover"}],
-    }
-
-
-def scenario_frontend_mismatch():
-    return {
-        "tickets": [{"id": i} for i in range(10)],
-        "errors": [
-            {"type": "frontend_state_mismatch", "service": "frontend"}
-            for _ in range(5)
-        ],
-        "checkouts": [{"status": "success"} for _ in range(15)],
-        "webhooks": [],
-        "migration_states": [{"stage": "stable"}],
-    }
-
-
-def scenario_healthy_system():
-    return {
-        "tickets": [{"id": 1}, {"id": 2}],
-        "errors": [],
-        "checkouts": [{"status": "success"} for _ in range(30)],
-        "webhooks": [],
-        "migration_states": [{"stage": "stable"}],
-    }
-
-
-SCENARIOS = [
-    scenario_checkout_failure,
-    scenario_webhook_failure,
-    scenario_frontend_mismatch,
-    scenario_healthy_system,
-]
+_SCENARIO_CHECKOUT_FAILURE = MappingProxyType({
+    "tickets": tuple({"id": i} for i in range(25)),
+    "errors": tuple(
+        {"type": "checkout_timeout", "service": "checkout"}
+        for _ in range(10)
+    ),
+    "checkouts": tuple({"status": "failed"} for _ in range(8)),
+    "webhooks": (),
+    "migration_states": ({"stage": "post-cutover"},),
+})
+
+_SCENARIO_WEBHOOK_FAILURE = MappingProxyType({
+    "tickets": tuple({"id": i} for i in range(15)),
+    "errors": tuple(
+        {"type": "webhook_401", "service": "webhook"}
+        for _ in range(6)
+    ),
+    "checkouts": tuple({"status": "success"} for _ in range(20)),
+    "webhooks": tuple({"status": "failed"} for _ in range(6)),
+    "migration_states": ({"stage": "post-cutover"},),
+})
+
+_SCENARIO_FRONTEND_MISMATCH = MappingProxyType({
+    "tickets": tuple({"id": i} for i in range(10)),
+    "errors": tuple(
+        {"type": "frontend_state_mismatch", "service": "frontend"}
+        for _ in range(5)
+    ),
+    "checkouts": tuple({"status": "success"} for _ in range(15)),
+    "webhooks": (),
+    "migration_states": ({"stage": "stable"},),
+})
+
+_SCENARIO_HEALTHY_SYSTEM = MappingProxyType({
+    "tickets": ({"id": 1}, {"id": 2}),
+    "errors": (),
+    "checkouts": tuple({"status": "success"} for _ in range(30)),
+    "webhooks": (),
+    "migration_states": ({"stage": "stable"},),
+})
+
+
+SCENARIOS = (
+    ("checkout_failure", _SCENARIO_CHECKOUT_FAILURE),
+    ("webhook_failure", _SCENARIO_WEBHOOK_FAILURE),
+    ("frontend_mismatch", _SCENARIO_FRONTEND_MISMATCH),
+    ("healthy_system", _SCENARIO_HEALTHY_SYSTEM),
+)
 
 
 # -----------------------------
@@ -106,7 +102,7 @@ class AgentRunner:
         self.actor = Actor()
         self.memory = Memory()
 
-    def run_once(self, raw_signals: dict):
+    def run_once(self, raw_signals: Mapping[str, Any]):
         observation = self.observer.observe(raw_signals)
         reasoning = self.reasoner.reason(observation)
         decision = self.decider.decide(observation, reasoning)
@@ -125,6 +121,8 @@ class AgentRunner:
 # -----------------------------
 if __name__ == "__main__":
 
+    logging.basicConfig(level=logging.WARNING)
+
     threading.Thread(target=start_ui_server, daemon=True).start()
     threading.Thread(target=open_browser, daemon=True).start()
 
@@ -133,14 +131,13 @@ if __name__ == "__main__":
     print("🚀 Agent running with live UI and real scenario variation...")
 
     while True:
-        scenario_fn = random.choice(SCENARIOS)
-        raw_signals = scenario_fn()
+        scenario_name, raw_signals = random.choice(SCENARIOS)
 
         incident_id = agent.run_once(raw_signals)
 
         print("✅ Agent run complete")
         print("Incident ID:", incident_id)
-        print("Scenario:", scenario_fn.__name__)
+        print("Scenario:", scenario_name)
         print("-" * 50)
 
         time.sleep(RUN_INTERVAL)
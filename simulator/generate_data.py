@@ -1,11 +1,25 @@
-import json
+import argparse
+import os
 import random
 import sys
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+    from numpy.random import default_rng
+except ImportError:  # NumPy is optional; sampling falls back to random
+    np = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+    import json as _json
+
 DATA_DIR = Path("data")
-DATA_DIR.mkdir(exist_ok=True)
 
 MERCHANTS = ["M1", "M2", "M3", "M4", "M5", "M6"]
 
@@ -27,97 +41,276 @@ TICKET_MESSAGES = [
 
 SERVICES = ["checkout", "webhook", "api", "frontend"]
 
+# Every generated record references these exact string objects (records
+# index into the lists above), so intern them once up front
+for _values in (MERCHANTS, ERROR_TYPES, TICKET_MESSAGES, SERVICES):
+    _values[:] = [sys.intern(v) for v in _values]
+del _values
+
+
+def _make_rng(value=None):
+    # PCG64-backed Generator when NumPy is present (never the legacy
+    # RandomState), otherwise a private stdlib Random
+    if np is not None:
+        return default_rng(value)
+    return random.Random(value)
+
+
+_rng = _make_rng()
+
+# Records are timestamped within this many minutes before now
+MAX_AGE_MINUTES = 90
+
+# Records encoded per os.write() call in save_json
+WRITE_CHUNK_RECORDS = 1024
+
+# Keep Windows from translating LF to CRLF on raw descriptors
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
 # -----------------------------
 # SCENARIO DEFINITIONS
 # -----------------------------
+@dataclass(frozen=True)
+class Scenario:
+    ticket_count: int
+    event_count: int
+    error_bias: tuple
+    service_bias: tuple
+
+
 SCENARIOS = {
-    "clear_misconfig": {
-        "ticket_count": 15,
-        "event_count": 20,
-        "error_bias": ["checkout_timeout"],
-        "service_bias": ["checkout"]
-    },
-    "webhook_failure": {
-        "ticket_count": 10,
-        "event_count": 15,
-        "error_bias": ["webhook_401"],
-        "service_bias": ["webhook"]
-    },
-    "conflicting_signals": {
-        "ticket_count": 20,
-        "event_count": 30,
-        "error_bias": ERROR_TYPES,
-        "service_bias": SERVICES
-    },
-    "low_signal_noise": {
-        "ticket_count": 3,
-        "event_count": 2,
-        "error_bias": [],
-        "service_bias": []
-    }
+    "clear_misconfig": Scenario(
+        ticket_count=15,
+        event_count=20,
+        error_bias=("checkout_timeout",),
+        service_bias=("checkout",)
+    ),
+    "webhook_failure": Scenario(
+        ticket_count=10,
+        event_count=15,
+        error_bias=("webhook_401",),
+        service_bias=("webhook",)
+    ),
+    "conflicting_signals": Scenario(
+        ticket_count=20,
+        event_count=30,
+        error_bias=tuple(ERROR_TYPES),
+        service_bias=tuple(SERVICES)
+    ),
+    "low_signal_noise": Scenario(
+        ticket_count=3,
+        event_count=2,
+        error_bias=(),
+        service_bias=()
+    )
 }
 
 # -----------------------------
 # GENERATORS
 # -----------------------------
+def seed(value):
+    """
+    Reseed the generators' random stream for reproducible output.
+    """
+    global _rng
+    _rng = _make_rng(value)
+
+
+def _sample_indices(n, *sizes):
+    """
+    Draw n uniform indices below each of sizes, one array per size.
+    """
+    if np is None:
+        # One C-level batch per field instead of a call per record
+        return [_rng.choices(range(k), k=n) for k in sizes]
+
+    return [_rng.integers(0, k, n) for k in sizes]
+
+
+def _timestamp_table():
+    # Offsets are whole minutes, so only MAX_AGE_MINUTES + 1 distinct
+    # timestamps exist per call; format each once and index into them
+    base_ts = int(time.time())
+    return [
+        datetime.utcfromtimestamp(base_ts - 60 * k).isoformat()
+        for k in range(MAX_AGE_MINUTES + 1)
+    ]
+
+
 def generate_tickets(n, error_bias):
-    tickets = []
-    for i in range(n):
-        tickets.append({
+    merchants = MERCHANTS
+    issues = error_bias or ERROR_TYPES
+    msgs = TICKET_MESSAGES
+
+    # Draw every field for all n records in one shot
+    m_idx, i_idx, msg_idx, mins = _sample_indices(
+        n, len(merchants), len(issues), len(msgs), MAX_AGE_MINUTES + 1
+    )
+    ts_table = _timestamp_table()
+
+    for i, (m, iss, msg, mm) in enumerate(zip(
+        m_idx, i_idx, msg_idx, mins
+    )):
+        yield {
             "ticket_id": f"T{i+1}",
-            "merchant_id": random.choice(MERCHANTS),
-            "issue": random.choice(error_bias or ERROR_TYPES),
-            "message": random.choice(TICKET_MESSAGES),
-            "timestamp": (
-                datetime.utcnow() - timedelta(minutes=random.randint(0, 90))
-            ).isoformat()
-        })
-    return tickets
+            "merchant_id": merchants[m],
+            "issue": issues[iss],
+            "message": msgs[msg],
+            "timestamp": ts_table[mm]
+        }
 
 
 def generate_events(n, error_bias, service_bias):
-    events = []
-    for i in range(n):
-        events.append({
+    merchants = MERCHANTS
+    errors = error_bias or ERROR_TYPES
+    services = service_bias or SERVICES
+
+    # Draw every field for all n records in one shot
+    m_idx, e_idx, s_idx, mins = _sample_indices(
+        n, len(merchants), len(errors), len(services), MAX_AGE_MINUTES + 1
+    )
+    ts_table = _timestamp_table()
+
+    for i, (m, err, svc, mm) in enumerate(zip(
+        m_idx, e_idx, s_idx, mins
+    )):
+        yield {
             "event_id": f"E{i+1}",
-            "merchant_id": random.choice(MERCHANTS),
-            "error_code": random.choice(error_bias or ERROR_TYPES),
-            "service": random.choice(service_bias or SERVICES),
-            "timestamp": (
-                datetime.utcnow() - timedelta(minutes=random.randint(0, 90))
-            ).isoformat()
-        })
-    return events
+            "merchant_id": merchants[m],
+            "error_code": errors[err],
+            "service": services[svc],
+            "timestamp": ts_table[mm]
+        }
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(record):
+        return _json.dumps(record, separators=(",", ":")).encode()
+
+
+# Record layouts are fixed, so without orjson records are rendered from
+# these instead of the slower stdlib encoder
+TICKET_TEMPLATE = (
+    '{{"ticket_id":"{ticket_id}","merchant_id":"{merchant_id}",'
+    '"issue":"{issue}","message":"{message}","timestamp":"{timestamp}"}}'
+)
+
+EVENT_TEMPLATE = (
+    '{{"event_id":"{event_id}","merchant_id":"{merchant_id}",'
+    '"error_code":"{error_code}","service":"{service}",'
+    '"timestamp":"{timestamp}"}}'
+)
+
+
+def _check_template_safe(values):
+    # Templates do no escaping, so reject anything JSON would escape
+    for v in values:
+        if '"' in v or "\\" in v or any(ord(c) < 0x20 for c in v):
+            raise ValueError(f"Value needs JSON escaping: {v!r}")
+
+
+def _write_all(fd, buf):
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def save_json(path, records, template=None):
+    """
+    Stream records to path as a JSON array, one record per line, so the
+    full dataset is never held in memory.
 
+    Records are encoded in chunks, each written with a single os.write()
+    to a temporary file that atomically replaces path once complete.
+    With a template, records are rendered with str.format_map instead of
+    a JSON encoder; a value that would need escaping raises ValueError.
+    """
+    if template is None:
+        encode = _dumps
+    else:
+        def encode(record):
+            _check_template_safe(record.values())
+            return template.format_map(record).encode()
 
-def save_json(path, data):
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(
+        tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644
+    )
+
+    try:
+        chunk = [b"["]
+        sep = b"\n  "
+        for i, record in enumerate(records, 1):
+            chunk.append(sep + encode(record))
+            sep = b",\n  "
+            if i % WRITE_CHUNK_RECORDS == 0:
+                _write_all(fd, b"".join(chunk))
+                chunk.clear()
+        chunk.append(b"\n]\n")
+        _write_all(fd, b"".join(chunk))
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+
+    os.close(fd)
+    os.replace(tmp, path)
 
 
 # -----------------------------
 # MAIN
 # -----------------------------
-if __name__ == "__main__":
-    scenario = sys.argv[1] if len(sys.argv) > 1 else "conflicting_signals"
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic tickets and events for a scenario."
+    )
+    parser.add_argument(
+        "scenario",
+        nargs="?",
+        default="conflicting_signals",
+        choices=SCENARIOS.keys()
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed the random stream for reproducible output"
+    )
+    args = parser.parse_args()
 
-    if scenario not in SCENARIOS:
-        raise ValueError(f"Unknown scenario: {scenario}")
+    if args.seed is not None:
+        seed(args.seed)
 
-    cfg = SCENARIOS[scenario]
+    cfg = SCENARIOS[args.scenario]
 
     tickets = generate_tickets(
-        cfg["ticket_count"],
-        cfg["error_bias"]
+        cfg.ticket_count,
+        cfg.error_bias
     )
 
     events = generate_events(
-        cfg["event_count"],
-        cfg["error_bias"],
-        cfg["service_bias"]
+        cfg.event_count,
+        cfg.error_bias,
+        cfg.service_bias
     )
 
-    save_json(DATA_DIR / "tickets.json", tickets)
-    save_json(DATA_DIR / "events.json", events)
+    DATA_DIR.mkdir(exist_ok=True)
+
+    # orjson outpaces the templates; they only stand in for stdlib json
+    if orjson is None:
+        ticket_template, event_template = TICKET_TEMPLATE, EVENT_TEMPLATE
+    else:
+        ticket_template = event_template = None
+
+    save_json(DATA_DIR / "tickets.json", tickets, ticket_template)
+    save_json(DATA_DIR / "events.json", events, event_template)
 
-    print(f"✅ Generated data for scenario: {scenario}")
+    print(f"✅ Generated data for scenario: {args.scenario}")
+
+
+if __name__ == "__main__":
+    main()
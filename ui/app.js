@@ -4,8 +4,12 @@ let activeIndex = null;
 /* ---------------- Load Memory ---------------- */
 async function loadMemory() {
   try {
-    const res = await fetch("../agent_memory.json");
-    const newMemory = await res.json();
+    const res = await fetch("../agent_memory.ndjson");
+    const text = await res.text();
+    const newMemory = text
+      .split("\n")
+      .filter(line => line.trim())
+      .map(line => JSON.parse(line));
 
     if (JSON.stringify(newMemory) !== JSON.stringify(memory)) {
       memory = newMemory.reverse();
@@ -30,9 +34,11 @@ function renderIncidentList() {
   memory.forEach((incident, index) => {
     const li = document.createElement("li");
 
-    const time = new Date(
-      incident.timestamp * 1000
-    ).toLocaleTimeString();
+    // Newer records store integer nanoseconds; older ones float seconds
+    const millis = incident.timestamp_ns !== undefined
+      ? incident.timestamp_ns / 1e6
+      : incident.timestamp * 1000;
+    const time = new Date(millis).toLocaleTimeString();
 
     li.textContent = `${incident.incident_id.slice(0, 8)} • ${time}`;
     li.onclick = () => selectIncident(index);